@@ -17,10 +17,35 @@ __all__ = [
 ]
 __author__ = ["Markus Löning", "@big-o"]
 
+import weakref
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 from sktime.utils.validation import is_int
 
+# period or datetime index are not support yet
+_SUPPORTED_INDEX_TYPES = (pd.RangeIndex, pd.Int64Index, pd.UInt64Index)
+
+# classes imported on first use by `check_cv` and `check_scoring`, importing
+# them at module level would create circular imports
+_BaseSplitter = None
+_MetricFunctionWrapper = None
+_sMAPE = None
+
+# arrays from this size on are scanned with a numba-compiled function by
+# `_check_sorted`, compiled on first use and False if numba is not installed
+_NUMBA_MIN_SIZE = 10000
+_numba_scan_sorted = None
+
+# forecasting horizons are usually short, only those up to this size are
+# cached by `check_fh_values`
+_FH_CACHE_MAX_SIZE = 64
+
+# weak references to time indices which have passed `check_time_index`,
+# keyed by id, since pandas indices are not hashable
+_CHECKED_TIME_INDICES = {}
+
 
 def check_y_X(y, X):
     """Validate input data.
@@ -30,15 +55,21 @@ def check_y_X(y, X):
     X : pandas DataFrame
     Returns
     -------
-    None
+    y : pandas Series
+    X : pandas DataFrame
     Raises
     ------
     ValueError
         If y is an invalid input
     """
+    # validate each index only once: the index of y in `check_y` and the
+    # index of X's series in `_check_X`, which is then compared to y's index
     y = check_y(y)
-    X = check_X(X)
-    check_consistent_time_index(y, X)
+    X_index = _check_X(X)
+    if X_index is not y.index:
+        check_time_index(X_index)
+        if not y.index.equals(X_index):
+            raise ValueError("Found inconsistent time indices.")
     return y, X
 
 
@@ -74,7 +105,16 @@ def check_y(y, allow_empty=False, allow_constant=True):
                 f"empty series: {y}")
 
     if not allow_constant:
-        if np.all(y == y.iloc[0]):
+        values = y.to_numpy()
+        if values.size == 0:
+            is_constant = False
+        elif values.dtype.kind in "biuf":
+            # single pass without allocating a boolean array, NaN values
+            # make min and max NaN and hence never compare as constant
+            is_constant = values.min() == values.max()
+        else:
+            is_constant = np.all(values == values[0])
+        if is_constant:
             raise ValueError("All values of `y` are the same")
 
     # check time index
@@ -95,10 +135,13 @@ def check_cv(cv):
     ValueError
         if cv does not have the required attributes.
     """
-    from sktime.forecasting.model_selection._split import BaseSplitter
-    allowed_base_class = BaseSplitter
-    if not isinstance(cv, allowed_base_class):
-        raise TypeError(f"`cv` is not an instance of {allowed_base_class}")
+    global _BaseSplitter
+    if _BaseSplitter is None:
+        from sktime.forecasting.model_selection._split import BaseSplitter
+        _BaseSplitter = BaseSplitter
+
+    if not isinstance(cv, _BaseSplitter):
+        raise TypeError(f"`cv` is not an instance of {_BaseSplitter}")
     return cv
 
 
@@ -113,24 +156,43 @@ def check_time_index(time_index):
     -------
     time_index : pd.Index
     """
+    # range indices with positive step are always supported and sorted
+    if type(time_index) is pd.RangeIndex and time_index.step > 0:
+        return time_index
+
+    # indices are immutable, so they only need to be checked once
+    if id(time_index) in _CHECKED_TIME_INDICES:
+        return time_index
+
     if isinstance(time_index, np.ndarray):
         time_index = pd.Index(time_index)
 
-    # period or datetime index are not support yet
-    supported_index_types = (pd.RangeIndex, pd.Int64Index, pd.UInt64Index)
-    if not isinstance(time_index, supported_index_types):
+    if not isinstance(time_index, _SUPPORTED_INDEX_TYPES):
         raise NotImplementedError(f"{type(time_index)} is not supported, "
                                   f"please use one of "
-                                  f"{supported_index_types} instead.")
+                                  f"{_SUPPORTED_INDEX_TYPES} instead.")
 
-    if not time_index.is_monotonic:
+    if not time_index.is_monotonic_increasing:
         raise ValueError(
             f"Time index must be sorted (monotonically increasing), "
             f"but found: {time_index}")
 
+    _register_checked_time_index(time_index)
     return time_index
 
 
+def _register_checked_time_index(time_index):
+    """Remember that time index has passed `check_time_index`"""
+    key = id(time_index)
+
+    # remove entry when index is garbage collected, as its id may be
+    # reused by another object afterwards
+    def _remove(_):
+        _CHECKED_TIME_INDICES.pop(key, None)
+
+    _CHECKED_TIME_INDICES[key] = weakref.ref(time_index, _remove)
+
+
 def check_X(X):
     """Validate input data.
 
@@ -147,6 +209,18 @@ def check_X(X):
     ValueError
         If y is an invalid input
     """
+    _check_X(X)
+    return X
+
+
+def _check_X(X):
+    """Validate input data, see `check_X`.
+
+    Returns
+    -------
+    time_index : pd.Index
+        Time index shared by all series in X.
+    """
     if not isinstance(X, pd.DataFrame):
         raise ValueError(f"`X` must a pandas DataFrame, but found: {type(X)}")
     if X.shape[0] > 1:
@@ -155,10 +229,21 @@ def check_X(X):
 
     # Check if index is the same for all columns.
 
-    # Get index from first row, can be either pd.Series or np.array.
-    first_index = X.iloc[0, 0].index if hasattr(X.iloc[0, 0],
-                                                'index') else pd.RangeIndex(
-        X.iloc[0, 0].shape[0])
+    # Get index from each column, can be either pd.Series or np.array. Cells
+    # of the single row are extracted at once, which is much faster than
+    # accessing each cell through pandas' indexers
+    cells = X.to_numpy()[0]
+    indices = []
+    for c, cell in enumerate(cells):
+        if isinstance(cell, (pd.Series, pd.DataFrame)):
+            indices.append(cell.index)
+        elif isinstance(cell, np.ndarray) and cell.ndim > 0:
+            indices.append(pd.RangeIndex(cell.shape[0]))
+        else:
+            raise ValueError(
+                f'Column {X.columns[c]} must contain a pd.Series or '
+                f'np.array, but found: {type(cell)}')
+    first_index = indices[0]
 
     # Series must contain now least 2 observations, otherwise should be
     # primitive.
@@ -167,17 +252,28 @@ def check_X(X):
             f'Time series must contain now least 2 observations, but found: '
             f'{len(first_index)} observations in column: {X.columns[0]}')
 
-    # Compare with remaining columns
-    for c, col in enumerate(X.columns):
-        index = X.iloc[0, c].index if hasattr(X.iloc[0, c],
-                                              'index') else pd.RangeIndex(
-            X.iloc[0, 0].shape[0])
-        if not np.array_equal(first_index, index):
+    # Compare with remaining columns, series often share the same index
+    # object
+    if any(index is not first_index for index in indices):
+        if all(len(index) == len(first_index) and
+               index.dtype == first_index.dtype for index in indices):
+            # compare all indices at once
+            stacked = np.stack([np.asarray(index) for index in indices])
+            is_equal = (stacked == stacked[0]).all(axis=1)
+        else:
+            # indices of different length or dtype cannot be stacked, e.g.
+            # integer and datetime indices cannot be promoted to a common
+            # dtype
+            is_equal = np.array([first_index.equals(index)
+                                 for index in indices])
+
+        if not is_equal.all():
+            col = X.columns[np.argmin(is_equal)]
             raise ValueError(
                 f'Found time series with unequal index in column {col}. '
                 f'Input time-series must have the same index.')
 
-    return X
+    return first_index
 
 
 def check_window_length(window_length):
@@ -271,14 +367,19 @@ def check_consistent_time_index(*ys, y_train=None):
     first_index = ys[0].index
     check_time_index(first_index)
     for y in ys[1:]:
-        check_time_index(y.index)
+        # series often share the same index object
+        if y.index is first_index:
+            continue
 
+        check_time_index(y.index)
         if not first_index.equals(y.index):
             raise ValueError("Found inconsistent time indices.")
 
     if y_train is not None:
-        check_time_index(y_train.index)
-        if y_train.index.max() >= first_index.min():
+        train_index = check_time_index(y_train.index)
+        # indices are sorted, so only the boundaries need to be compared
+        if len(train_index) > 0 and len(first_index) > 0 and \
+                train_index[-1] >= first_index[0]:
             raise ValueError("Found `y_train` with time index which is not "
                              "before time index of `y_pred`")
 
@@ -293,21 +394,28 @@ def check_alpha(alpha):
     ------
     ValueError
         If alpha is outside the range (0, 1).
+    TypeError
+        If alpha is neither a float nor a list.
     """
-    # check type
+    # check type, only the distinct element types have to be checked
     if isinstance(alpha, list):
-        if not all(isinstance(a, float) for a in alpha):
+        if not all(issubclass(t, float) for t in set(map(type, alpha))):
             raise ValueError("When `alpha` is passed as a list, "
                              "it must be a list of floats")
 
     elif isinstance(alpha, float):
         alpha = [alpha]  # make iterable
 
-    # check range
-    for a in alpha:
-        if not 0 < a < 1:
-            raise ValueError(f"`alpha` must lie in the open interval (0, 1), "
-                             f"but found: {a}.")
+    else:
+        raise TypeError(f"`alpha` must be a float or a list of floats, "
+                        f"but found: {type(alpha)}")
+
+    # check range of all values at once
+    values = np.asarray(alpha, dtype=np.float64)
+    is_valid = (values > 0) & (values < 1)
+    if not is_valid.all():
+        raise ValueError(f"`alpha` must lie in the open interval (0, 1), "
+                         f"but found: {values[~is_valid][0]}.")
 
     return alpha
 
@@ -317,30 +425,45 @@ def check_cutoffs(cutoffs):
         raise ValueError(
             f"`cutoffs` must be a np.array, but found: {type(cutoffs)}")
 
-    if not all([is_int(cutoff) for cutoff in cutoffs]):
-        raise ValueError("All cutoff points must be integers")
-
     if not cutoffs.ndim == 1:
         raise ValueError("`cutoffs must be 1-dimensional array")
 
     if not len(cutoffs) > 0:
         raise ValueError("Found empty `cutoff` array")
 
+    # the dtype tells if all values are integers, only object arrays have
+    # to be checked element-wise
+    if cutoffs.dtype == object:
+        is_integer = all(is_int(cutoff) for cutoff in cutoffs)
+    else:
+        is_integer = np.issubdtype(cutoffs.dtype, np.integer)
+    if not is_integer:
+        raise ValueError("All cutoff points must be integers")
+
+    # skip sorting if cutoffs are already sorted, but still copy them so that
+    # input arrays are left unchanged
+    if len(cutoffs) < 2 or _check_sorted(cutoffs)[0]:
+        return cutoffs.copy()
+
     return np.sort(cutoffs)
 
 
 def check_scoring(scoring):
-    from sktime.performance_metrics.forecasting._classes import \
-        MetricFunctionWrapper
-    from sktime.performance_metrics.forecasting import sMAPE
+    global _MetricFunctionWrapper, _sMAPE
+    if _MetricFunctionWrapper is None:
+        from sktime.performance_metrics.forecasting._classes import \
+            MetricFunctionWrapper
+        from sktime.performance_metrics.forecasting import sMAPE
+        _MetricFunctionWrapper = MetricFunctionWrapper
+        _sMAPE = sMAPE
 
     if scoring is None:
-        return sMAPE()
+        return _sMAPE()
 
     if not callable(scoring):
         raise TypeError("`scoring` must be a callable object")
 
-    allowed_base_class = MetricFunctionWrapper
+    allowed_base_class = _MetricFunctionWrapper
     if not isinstance(scoring, allowed_base_class):
         raise TypeError(
             f"`scoring` must inherit from `{allowed_base_class.__name__}`")
@@ -351,6 +474,10 @@ def check_scoring(scoring):
 def check_fh_values(values):
     """Validate forecasting horizon values.
 
+    Results for short forecasting horizons are cached, so that repeated
+    calls with the same values skip re-validation. Cached arrays are
+    read-only, as they are shared between calls.
+
     Parameters
     ----------
     values : int, list of int, array of int
@@ -365,40 +492,200 @@ def check_fh_values(values):
     fh : numpy array of int
         Sorted and validated forecasting horizon.
     """
-    # check single integer
-    if is_int(values):
-        values = np.array([values], dtype=np.int)
-
-    # check array
-    elif isinstance(values, np.ndarray):
-        if values.ndim > 1:
-            raise TypeError(f"`fh` must be a 1d array, but found shape: "
-                            f"{values.shape}")
-
-        if not np.issubdtype(values.dtype, np.integer):
-            raise TypeError(f"If `fh` is passed as an array, it must "
-                            f"be an array of integers, but found an "
-                            f"array of type: {values.dtype}")
-
-    # check list
-    elif isinstance(values, list):
-        if not np.all([is_int(h) for h in values]):
-            raise TypeError("If `fh` is passed as a list, "
-                            "it has to be a list of integers.")
-        values = np.array(values, dtype=np.int)
+    key = _fh_cache_key(values)
+    if key is None:
+        return _check_fh_values(values)
+    return _check_fh_values_cached(key)
+
+
+def _fh_cache_key(values):
+    """Get hashable cache key for forecasting horizon values.
 
+    Element types are part of the key, since e.g. `True == 1` and `1.0 == 1`
+    but only integers are valid values.
+
+    Returns
+    -------
+    key : tuple or None
+        None if values cannot be cached.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind not in "iu" or values.size > _FH_CACHE_MAX_SIZE:
+            return None
+        return np.ndarray, values.dtype.str, values.shape, values.tobytes()
+
+    if isinstance(values, list):
+        if len(values) > _FH_CACHE_MAX_SIZE:
+            return None
+        key = list, tuple(values), tuple(map(type, values))
     else:
-        raise TypeError(f"`fh` has to be either a numpy array, list, "
-                        f"or a single integer, but found: {type(values)}")
+        key = type(values), values
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@lru_cache(maxsize=128)
+def _check_fh_values_cached(key):
+    """Cached version of `_check_fh_values`, see `_fh_cache_key`"""
+    # reconstruct values from key
+    if key[0] is np.ndarray:
+        _, dtype, shape, buffer = key
+        values = np.frombuffer(buffer, dtype=dtype).reshape(shape)
+    elif key[0] is list:
+        values = list(key[1])
+    else:
+        values = key[1]
+
+    values = _check_fh_values(values)
+    values.setflags(write=False)
+    return values
+
+
+def _fh_from_int(values):
+    """Convert single integer to fh array"""
+    return np.asarray((values,), dtype=np.intp)
+
+
+def _fh_from_array(values):
+    """Check fh array"""
+    if values.ndim > 1:
+        raise TypeError(f"`fh` must be a 1d array, but found shape: "
+                        f"{values.shape}")
+
+    if not np.issubdtype(values.dtype, np.integer):
+        raise TypeError(f"If `fh` is passed as an array, it must "
+                        f"be an array of integers, but found an "
+                        f"array of type: {values.dtype}")
+    return values
+
+
+def _fh_from_list(values):
+    """Check fh list and convert it to array"""
+    # only the distinct element types have to be checked
+    if not all(issubclass(t, (int, np.integer)) and
+               not issubclass(t, bool)
+               for t in set(map(type, values))):
+        raise TypeError("If `fh` is passed as a list, "
+                        "it has to be a list of integers.")
+    return np.asarray(values, dtype=np.intp)
+
+
+# fh input checks by exact type, subclasses (e.g. numpy integers or FH) are
+# dispatched by `_check_fh_values` using isinstance
+_FH_HANDLERS = {
+    int: _fh_from_int,
+    np.ndarray: _fh_from_array,
+    list: _fh_from_list,
+}
+
+
+def _check_fh_values(values):
+    """Validate forecasting horizon values, see `check_fh_values`"""
+    handler = _FH_HANDLERS.get(type(values))
+    if handler is None:
+        if is_int(values):
+            handler = _fh_from_int
+        elif isinstance(values, np.ndarray):
+            handler = _fh_from_array
+        elif isinstance(values, list):
+            handler = _fh_from_list
+        else:
+            raise TypeError(f"`fh` has to be either a numpy array, list, "
+                            f"or a single integer, but found: "
+                            f"{type(values)}")
+    values = handler(values)
 
     # check fh is not empty
     if len(values) < 1:
         raise TypeError("`fh` cannot be empty, please specify now least one "
                         "step to forecast.")
 
+    # long fh are usually already sorted, in which case duplicates can be
+    # found in a single scan without sorting
+    is_sorted = False
+    if len(values) >= _NUMBA_MIN_SIZE:
+        is_sorted, has_duplicates = _check_sorted(values)
+
+    # copy or sort fh, so that input arrays are left unchanged
+    if is_sorted:
+        values = values.copy()
+    else:
+        values = np.sort(values)
+
+        # duplicates are adjacent after sorting; for short fh, a set is
+        # faster than calling into numpy
+        if len(values) <= 4:
+            has_duplicates = len(set(values.tolist())) < len(values)
+        else:
+            has_duplicates = (np.diff(values) == 0).any()
+
     # check fh does not contain duplicates
-    if len(values) != len(np.unique(values)):
+    if has_duplicates:
         raise TypeError("`fh` should not contain duplicates.")
 
-    # sort fh
-    return np.sort(values)
+    return values
+
+
+def _scan_sorted(values):
+    """Check if 1d array is sorted and contains duplicates in a single pass.
+
+    Compiled with numba by `_check_sorted` if available.
+    """
+    has_duplicates = False
+    for i in range(1, values.shape[0]):
+        if values[i] < values[i - 1]:
+            return False, has_duplicates
+        if values[i] == values[i - 1]:
+            has_duplicates = True
+    return True, has_duplicates
+
+
+def _get_numba_scan_sorted():
+    """Compile `_scan_sorted` with numba on first use.
+
+    Returns
+    -------
+    scan_sorted : function or None
+        None if numba is not installed.
+    """
+    global _numba_scan_sorted
+    if _numba_scan_sorted is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _numba_scan_sorted = False
+        else:
+            _numba_scan_sorted = njit(cache=True)(_scan_sorted)
+    return _numba_scan_sorted or None
+
+
+def _check_sorted(values):
+    """Check if 1d array is sorted and contains duplicates.
+
+    Parameters
+    ----------
+    values : np.array
+
+    Returns
+    -------
+    is_sorted : bool
+        True if values are sorted in increasing order.
+    has_duplicates : bool
+        True if values contain duplicates, only valid if values are sorted.
+    """
+    # for long arrays, a single compiled pass halves the memory traffic of
+    # the numpy version below, for short arrays it is not worth the call
+    # overhead
+    if len(values) >= _NUMBA_MIN_SIZE and values.dtype.kind in "iu":
+        scan_sorted = _get_numba_scan_sorted()
+        if scan_sorted is not None:
+            return scan_sorted(values)
+
+    # compare neighbours rather than using np.diff, which wraps around for
+    # unsigned integers
+    previous, current = values[:-1], values[1:]
+    return bool((current >= previous).all()), bool((current == previous).any())
@@ -1,11 +1,38 @@
 __author__ = ["Markus Löning"]
-__all__ = ["test_check_fh_bad_input_args"]
+__all__ = [
+    "test_check_fh_bad_input_args",
+    "test_check_fh_values_cached",
+    "test_check_fh_values_cache_types",
+    "test_check_X_unequal_index",
+    "test_check_X_bad_cell",
+    "test_check_fh_values_long",
+    "test_check_time_index_range_index",
+    "test_check_cutoffs_bad_input_args",
+    "test_check_cutoffs_sorted",
+    "test_check_y_X_inconsistent_index",
+    "test_check_y_X_series_index",
+    "test_check_y_constant",
+    "test_check_y_not_constant",
+    "test_check_consistent_time_index",
+    "test_check_consistent_time_index_y_train",
+    "test_check_alpha",
+    "test_check_alpha_bad_input_args"
+]
 
 import numpy as np
+import pandas as pd
 import pytest
 from pytest import raises
 
+from sktime.utils.validation import forecasting
+from sktime.utils.validation.forecasting import check_X
+from sktime.utils.validation.forecasting import check_alpha
+from sktime.utils.validation.forecasting import check_consistent_time_index
+from sktime.utils.validation.forecasting import check_cutoffs
 from sktime.utils.validation.forecasting import check_fh_values
+from sktime.utils.validation.forecasting import check_time_index
+from sktime.utils.validation.forecasting import check_y
+from sktime.utils.validation.forecasting import check_y_X
 
 bad_input_args = (
     (1, 2),  # tuple
@@ -26,3 +53,206 @@ bad_input_args = (
 def test_check_fh_bad_input_args(arg):
     with raises(TypeError):
         check_fh_values(arg)
+
+
+@pytest.mark.parametrize("arg", [1, [1, 3, 2], np.array([3, 1, 2])])
+def test_check_fh_values_cached(arg):
+    fh = check_fh_values(arg)
+    assert not fh.flags.writeable
+    np.testing.assert_array_equal(fh, check_fh_values(arg))
+
+
+@pytest.mark.parametrize("valid, invalid", [
+    (1, True),
+    (1, 1.0),
+    ([1, 2], [True, 2]),
+    ([1, 2], [1.0, 2]),
+])
+def test_check_fh_values_cache_types(valid, invalid):
+    # equal but invalid values must not hit cached results of valid values
+    check_fh_values(valid)
+    with raises(TypeError):
+        check_fh_values(invalid)
+
+
+@pytest.mark.parametrize("index", [
+    pd.Int64Index([0, 1, 3]),  # different values
+    pd.RangeIndex(4),  # different length
+    pd.date_range("2000", periods=3),  # different dtype
+])
+def test_check_X_unequal_index(index):
+    x = pd.Series(np.zeros(3))
+    X = pd.DataFrame({"a": [x], "b": [x]})
+    check_X(X)
+
+    X["c"] = [pd.Series(np.zeros(len(index)), index=index)]
+    with raises(ValueError, match="column c"):
+        check_X(X)
+
+
+@pytest.mark.parametrize("cell", [1.0, "a", [1.0, 2.0], np.array(1.0)])
+def test_check_X_bad_cell(cell):
+    X = pd.DataFrame({"a": [pd.Series(np.zeros(3))], "b": [cell]})
+    with raises(ValueError, match="Column b"):
+        check_X(X)
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("dtype", [np.int64, np.uint64])
+@pytest.mark.parametrize("sort", [True, False])
+def test_check_fh_values_long(sort, dtype, use_numba, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr(forecasting, "_numba_scan_sorted", False)
+
+    values = np.arange(1, 20001, dtype=dtype)
+    if not sort:
+        values = values[::-1]
+    fh = check_fh_values(values)
+    np.testing.assert_array_equal(fh, np.arange(1, 20001))
+    assert not np.shares_memory(fh, values)
+
+    values[5] = values[6]
+    with raises(TypeError):
+        check_fh_values(values)
+
+
+def test_check_time_index_range_index():
+    index = pd.RangeIndex(3, 10)
+    assert check_time_index(index) is index
+
+    with raises(ValueError):
+        check_time_index(pd.RangeIndex(10, 3, -1))
+
+
+bad_cutoffs = (
+    [1, 2],  # list
+    np.array([]),  # empty array
+    np.array([[1, 2]]),  # 2d array
+    np.array([0.1, 2]),  # float in array
+    np.array([True, False]),  # boolean array
+    np.array([1, "2"], dtype=object),  # string in object array
+)
+
+
+@pytest.mark.parametrize("cutoffs", bad_cutoffs)
+def test_check_cutoffs_bad_input_args(cutoffs):
+    with raises(ValueError):
+        check_cutoffs(cutoffs)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.uint64])
+@pytest.mark.parametrize("cutoffs", [[2, 5], [5, 2], [7, 2, 5]])
+def test_check_cutoffs_sorted(cutoffs, dtype):
+    cutoffs = np.array(cutoffs, dtype=dtype)
+    checked = check_cutoffs(cutoffs)
+    np.testing.assert_array_equal(checked, np.sort(cutoffs))
+    assert not np.shares_memory(checked, cutoffs)
+
+
+def test_check_y_X_inconsistent_index():
+    y = pd.Series(np.arange(5.0))
+    X = pd.DataFrame({"a": [pd.Series(np.ones(5))], "b": [np.zeros(5)]})
+    check_y_X(y, X)
+
+    with raises(ValueError):
+        check_y_X(y.iloc[1:], X)
+
+
+def test_check_y_X_series_index():
+    # y is compared to the time index of X's series, not X's row index
+    y = pd.Series(np.arange(5.0))
+    X = pd.DataFrame({"a": [np.ones(5)], "b": [np.zeros(5)]})
+    check_y_X(y, X)
+
+    # X's time index must be of a supported type, even if values are equal
+    x = pd.Series(np.ones(5), index=pd.Float64Index(np.arange(5.0)))
+    with raises(NotImplementedError):
+        check_y_X(y, pd.DataFrame({"a": [x]}))
+
+
+@pytest.mark.parametrize("values", [
+    [1.0, 1.0, 1.0],  # float
+    [1, 1, 1],  # int
+    [True, True, True],  # boolean
+])
+def test_check_y_constant(values):
+    y = pd.Series(values)
+    check_y(y)
+    with raises(ValueError):
+        check_y(y, allow_constant=False)
+
+
+@pytest.mark.parametrize("values", [
+    [1.0, 1.0, 2.0],
+    [1.0, 1.0, np.nan],  # NaN is never equal to other values
+    [np.nan, np.nan, np.nan],
+    [],
+])
+def test_check_y_not_constant(values):
+    y = pd.Series(values, dtype=float)
+    check_y(y, allow_empty=True, allow_constant=False)
+
+
+def test_check_consistent_time_index():
+    index = pd.Int64Index([3, 4, 5])
+    y = pd.Series(np.zeros(3), index=index)
+
+    # series sharing the same index object, or an equal one
+    check_consistent_time_index(y, pd.Series(np.ones(3), index=index))
+    check_consistent_time_index(y, pd.Series(np.ones(3), index=[3, 4, 5]))
+
+    with raises(ValueError):
+        check_consistent_time_index(y, pd.Series(np.ones(3)))
+
+    # unsupported index types are rejected before comparing values
+    with raises(NotImplementedError):
+        check_consistent_time_index(
+            y, pd.Series(np.ones(3), index=pd.date_range("2000", periods=3)))
+
+
+@pytest.mark.parametrize("train_index, is_valid", [
+    (pd.RangeIndex(3), True),  # ends before y
+    (pd.Int64Index([0, 2]), True),
+    (pd.RangeIndex(4), False),  # ends at start of y
+    (pd.Int64Index([0, 5]), False),  # ends after start of y
+    (pd.RangeIndex(0), True),  # empty
+])
+def test_check_consistent_time_index_y_train(train_index, is_valid):
+    y = pd.Series(np.zeros(3), index=pd.Int64Index([3, 4, 5]))
+    y_train = pd.Series(np.zeros(len(train_index)), index=train_index)
+    if is_valid:
+        check_consistent_time_index(y, y_train=y_train)
+    else:
+        with raises(ValueError):
+            check_consistent_time_index(y, y_train=y_train)
+
+    # empty y is not compared to y_train
+    check_consistent_time_index(y.iloc[:0], y_train=y_train)
+
+
+@pytest.mark.parametrize("alpha, expected", [
+    (0.1, [0.1]),
+    (np.float64(0.1), [0.1]),
+    ([0.1, 0.5], [0.1, 0.5]),
+])
+def test_check_alpha(alpha, expected):
+    assert check_alpha(alpha) == expected
+
+
+@pytest.mark.parametrize("alpha, error", [
+    (1.5, ValueError),  # out of range
+    (0.0, ValueError),  # out of range
+    ([0.1, 1.0], ValueError),  # out of range in list
+    ([0.1, float("nan")], ValueError),  # nan in list
+    ([0.1, 1], ValueError),  # int in list
+    (["0.5"], ValueError),  # string in list
+    ("0.5", TypeError),  # string
+    (1, TypeError),  # int
+    (None, TypeError),
+    (np.float32(0.3), TypeError),  # not a Python float
+    (np.array(0.5), TypeError),  # array
+    ((0.1, 0.5), TypeError),  # tuple
+])
+def test_check_alpha_bad_input_args(alpha, error):
+    with raises(error):
+        check_alpha(alpha)